@@ -1,4 +1,4 @@
-import itertools
+import sys
 import logging
 import inspect
 from types import MappingProxyType
@@ -57,6 +57,7 @@ from .members import (
     CONFIG,
     INFORM,
     STATES,
+    set_item_config,
 )
 from .comtypes import Null, ItemTMember
 
@@ -67,6 +68,19 @@ _P = ParamSpec("_P")
 ITEM_METADATA = "__dearpypixl__"
 
 
+class _StateMemberNames(dict):
+    """Maps DearPyGui state names to their (interned) DearPyPixl member
+    names i.e. "hovered" -> "is_hovered". Names are built once, on first use.
+    """
+    __slots__ = ()
+
+    def __missing__(self, state: str) -> str:
+        self[state] = member_name = sys.intern(f"is_{state}")
+        return member_name
+
+_STATE_MEMBER_NAMES = _StateMemberNames()
+
+
 class ItemData(Mapping):
     """Contains ItemType metadata. Assists in the registration of managed item type
     members into one of three managed categories. It is expected that the contents
@@ -147,6 +161,7 @@ class ItemData(Mapping):
         "members",
         "repr",
         "template",
+        "callbacks",
         "internal_only",
     )
 
@@ -267,6 +282,7 @@ class ItemData(Mapping):
         self.constants     = tuple(constants) if constants is not Null else constants
         self.internal_only = internal_only
         self.template      = None
+        self.callbacks     = ()
 
         # recast in _finalize
         self.members = (set(config), set(inform), set(states), set())
@@ -292,8 +308,10 @@ class ItemData(Mapping):
         """Recasts several attribute values to make them immutable.
         """
         self.parameters   = MappingProxyType(self.parameters)
-        self.members      = tuple(tuple(coll) for coll in self.members)
+        self.members      = tuple(frozenset(map(sys.intern, coll)) for coll in self.members)
         self.repr = tuple(self.repr)
+        # `callback`, `drag_callback`, `drop_callback`, etc.
+        self.callbacks    = tuple(p for p in self.parameters if "callback" in p)
 
     @property
     def identity(self):
@@ -406,7 +424,7 @@ class ItemData(Mapping):
                 slot.add(name)
                 if repr:
                     self.repr.append(name)
-            except TypeError:  # finalized metadata
+            except (TypeError, AttributeError):  # finalized metadata
                 raise RuntimeError(f"Cannot mutate managed members after ItemType creation.") from None
 
             if value is not self.NULL:
@@ -494,6 +512,7 @@ class ItemTemplate(MutableMapping, metaclass=ABCMeta): # Unrelated to DearPyGui
 
     __dearpypixl__: ItemData
     __itemtype__  : type['ItemT']
+    __itemnames__ : frozenset[str]  # `dir(__itemtype__)`
 
     @classmethod
     def new_template_type(cls, itemtype: type['ItemT']) -> type[Self]:
@@ -502,6 +521,7 @@ class ItemTemplate(MutableMapping, metaclass=ABCMeta): # Unrelated to DearPyGui
             "__slots__"     : tuple(metadata.parameters.keys()),
             "__dearpypixl__": metadata,
             "__itemtype__"  : itemtype,
+            "__itemnames__" : frozenset(dir(itemtype)),
         }
         return type(
             f"{itemtype.__qualname__}Template",
@@ -533,7 +553,7 @@ class ItemTemplate(MutableMapping, metaclass=ABCMeta): # Unrelated to DearPyGui
         # The ItemTemplate signature should mimic the ItemType's
         # signature. Since this isn't actually an item, an
         # attribute may be unavailable at the time of access.
-        if attr in dir(self.__itemtype__):
+        if attr in self.__itemnames__:
             raise NotImplementedError(f"{attr!r} member is not available as a template.")
         raise AttributeError(f"{type(self).__qualname__!r} object has no attribute {attr!r}.")
 
@@ -635,12 +655,6 @@ class ItemType(metaclass=ItemTypeMeta):
 
         itemtype_is_public = is_itemtype_public_api(cls)
 
-        # TODO: Maybe a less hacky implementation
-        if itemtype_mdata.is_callable:
-            for config in itemtype_mdata.members[0]:
-                if "callback" in config:
-                    ...
-
         # Build a new ItemTemplate class.
         if itemtype_is_public and not issubclass(cls, AppItem):
             itemtype_mdata.template = ItemTemplate.new_template_type(cls)
@@ -654,8 +668,9 @@ class ItemType(metaclass=ItemTypeMeta):
 
 
     def __repr__(self):
+        # `str.join` builds a list from a generator anyway; pass it one.
         repr_str = ", ".join(
-            (f"{m}={getattr(self, m)!r}" for m in self.__dearpypixl__.repr)
+            [f"{m}={getattr(self, m)!r}" for m in self.__dearpypixl__.repr]
         )
         return f"{type(self).__qualname__}({repr_str})"
 
@@ -709,11 +724,27 @@ class ItemType(metaclass=ItemTypeMeta):
         return registry._itemtypes.get.by_typeid_number(*cls.__dearpypixl__.able_children)
 
     def configure(self, **config) -> None:
-        """Update the item's configuration or other attributes. Equivelent to
-        recursively invoking `setattr`.
+        """Update the item's configuration or other attributes. Options are
+        applied in the order given, as if by invoking `setattr` for each.
         """
+        # Consecutive members that are only forwarded to `configure_item` are
+        # updated through a single call instead of one call per member. The
+        # pending batch is flushed before any other member is set so that
+        # order-dependent options (i.e. `source`, then `default_value`) still
+        # apply in the caller's order.
+        itemtype   = type(self)
+        dpg_config = {}
         for key, value in config.items():
+            member = getattr(itemtype, key, None)
+            if type(member) is ItemMember and member._fset is set_item_config:
+                dpg_config[member._target] = value
+                continue
+            if dpg_config:
+                configure_item(self._tag, **dpg_config)
+                dpg_config.clear()
             setattr(self, key, value)
+        if dpg_config:
+            configure_item(self._tag, **dpg_config)
 
     def configuration(self) -> dict[str, Any]:
         """Return the configuration members for the item along with their current
@@ -753,8 +784,9 @@ class ItemType(metaclass=ItemTypeMeta):
         # NOTE: (see `configuration` method NOTE) Unlike properties hooking onto
         # configuration, there's almost zero reason for a user to redefine a state
         # property.
-        ste_attrs  = {f"is_{state}":v for state, v in get_item_state(self.tag).items()}
-        dpg_states = self.__dearpypixl__.members[2]
+        member_names = _STATE_MEMBER_NAMES
+        ste_attrs    = {member_names[state]:v for state, v in get_item_state(self.tag).items()}
+        dpg_states   = self.__dearpypixl__.members[2]
         return {attr:(ste_attrs[attr] if attr in ste_attrs else getattr(self, attr))
                 for attr in dpg_states}
 
@@ -820,9 +852,21 @@ class AppItem(ItemType):
 
     @classmethod
     def configuration(cls):
-        cfg_attrs = cls.__dearpypixl__.members[0]
-        instance  = cls.__itemproxy__
-        return {attr:getattr(instance, attr) for attr in cfg_attrs}
+        # Same fallback approach as `ItemType.configuration`; most members
+        # read from a single DearPyGui configuration dict, so fetch it once
+        # instead of once per member.
+        cfg_attrs  = cls.__dearpypixl__.members[0]
+        instance   = cls.__itemproxy__
+        dpg_config = cls._configuration()
+        return {attr:(dpg_config[attr] if attr in dpg_config else getattr(instance, attr))
+                for attr in cfg_attrs}
+
+    @classmethod
+    def _configuration(cls) -> dict[str, Any]:
+        """Return the raw DearPyGui configuration for the item (used by the
+        `configuration` method). Empty by default.
+        """
+        return {}
 
     @classmethod
     def information(cls):
@@ -906,23 +950,22 @@ class Item(ItemType):
             Defaults to True.
         """
         super().__init__()
+        metadata = self.__dearpypixl__
         # create the "unaccessable member" cache and pre-populate w/those members
-        self.__itemdict__ = itemdict = dict.fromkeys(self.__dearpypixl__.members[3], None)
+        self.__itemdict__ = itemdict = dict.fromkeys(metadata.members[3], None)
         self._is_salvage  = False
 
         # Configuration pre-processing is normally done by descriptors, but they won't have an
         # opportunity to do so here.
         user_data = kwargs.pop("user_data", None)  # leave alone - DPG won't complain regardless of value
+        callbacks = metadata.callbacks
         for arg, val in kwargs.items():
-            if "callback" in arg and val:  # `callback`, `drag_callback`, `drop_callback`
-                is_sequence = isinstance(val, Sequence)
-                is_event    = isinstance(val, Event)
+            if arg in callbacks:
                 # an `Event` instance is set as-is
-                if not is_event:
-                    if not is_sequence:
+                if val and not isinstance(val, Event):
+                    if not isinstance(val, Sequence):
                         val = (val,)
-                    val = EventStack(val, sender=self)
-                kwargs[arg] = val
+                    kwargs[arg] = EventStack(val, sender=self)
                 continue
             if isinstance(val, (ItemType, IntEnum)):
                 kwargs[arg] = int(val)  # int(Item) -> Item.tag
@@ -938,7 +981,7 @@ class Item(ItemType):
             alias      = identifier
             identifier = generate_uuid()
         try:
-            self._tag = self.__dearpypixl__.command(tag=identifier, **kwargs)
+            self._tag = metadata.command(tag=identifier, **kwargs)
         except SystemError:
             raise errors.err_item_not_created(self, {"tag": identifier, **kwargs})
         alias and add_alias(alias, identifier)
@@ -1113,10 +1156,15 @@ class Item(ItemType):
             * stop (int, optional): Used in slicing the child slot to limit the search to a
             particular sequence of that child slot. Default is None.
         """
-        if self.is_root_item or (parent := self.parent) is None:
+        if self.is_root_item:
+            return None
+        # `self.parent` would fetch this item's info a second time.
+        item_info = get_item_info(self._tag)
+        parent_id = item_info["parent"]
+        if registry.get_item(parent_id, None) is None:
             return None
-        slot_idx = get_item_info(self)["target"]
-        slot_pos = get_item_info(parent.tag)["children"][slot_idx].index(self.tag)
+        slot_idx = item_info["target"]
+        slot_pos = get_item_info(parent_id)["children"][slot_idx].index(self._tag)
         return slot_idx, slot_pos
 
     def get_item_tree(self, from_root: bool = True) -> dict['Item', list[list['Item', list]]]:
@@ -1162,17 +1210,15 @@ class Item(ItemType):
             children from all slots will be included -- However, they will be
             unordered (order is preserved otherwise). Default is None.
         """
-        appitems    = registry._items
+        get_item    = registry._items.__getitem__
         child_slots = self._children()
         if slot is None:
-            children = [appitems[child_id] for child_id in
-                        itertools.chain.from_iterable(child_slots)]
-        else:
-            children = [appitems[child_id] for child_id in child_slots[slot]]
-        return tuple(children)
+            return tuple(map(get_item, chain.from_iterable(child_slots.values())))
+        return tuple(map(get_item, child_slots[slot]))
 
-    def _children(self) -> list[int]:
-        return [*get_item_info(self._tag)["children"].values()]
+    def _children(self) -> dict[int, list[int]]:
+        # Keyed by slot number, so it can be indexed like a list of slots.
+        return get_item_info(self._tag)["children"]
 
     def push_container(self) -> Self:
         """Add this item to the top of the container stack. TypeError is raised if
@@ -1204,8 +1250,12 @@ class Item(ItemType):
             * before (int, optional): id of the child item that the widget
             will be placed above/before.
         """
+        # `int(Item)` is a Python-level call; convert once and reuse the
+        # tags below.
+        parent = int(parent)
+        before = int(before)
         try:
-            move_item(self._tag, parent=int(parent), before=int(before))
+            move_item(self._tag, parent=parent, before=before)
         except SystemError:
             errors.err_if_existential_crisis(self)
             errors.err_if_root_item(self)
@@ -1354,13 +1404,10 @@ class Item(ItemType):
             * slot (int, optional): Only children in this slot will be deleted if
             <children_only> is True. Default is -1 (all slots).
         """
-        try:
+        if does_item_exist(self._tag):
             delete_item(self._tag, children_only=children_only, slot=slot)
-        except SystemError:
-            pass
-        finally:
-            if __refresh:
-                registry.refresh()
+        if __refresh:
+            registry.refresh()
 
     def recycle(self) -> Self:
         """Return this instance after destroying the underlying item. Salvage safe.
@@ -42,7 +42,7 @@ from ._internal.item import (
 
 if TYPE_CHECKING:
     from .theme import Theme
-    from .events import FrameEvents, Key
+    from .events import FrameEvents
     from .font import Font, FontFamily
 
 logging.info("")
@@ -119,6 +119,10 @@ class Application(AppItem):
     init_file          : str  = __dearpypixl__.set_configuration(_get_app_config, _set_app_config)
     auto_save_init_file: bool = __dearpypixl__.set_configuration(_get_app_config, _set_app_config)
 
+    @classmethod
+    def _configuration(cls) -> dict[str, Any]:
+        return get_app_configuration()
+
     @property
     @__dearpypixl__.as_configuration
     def font_scale(self) -> float:
@@ -343,32 +347,32 @@ class Application(AppItem):
         return is_dearpygui_running()
 
     @staticmethod
-    def is_key_pressed(key: Key | int) -> bool:
+    def is_key_pressed(key: int) -> bool:
         """Return True if `key` is pressed, otherwise return False.
 
         Args:
-            * key (Key | Mouse | int): Key | int event code to inquire
-            about.
+            * key (int): `Key` or `Mouse` member (or any int) event code to
+            inquire about.
         """
         return is_key_pressed(int(key))
 
     @staticmethod
-    def is_key_released(key: Key | int) -> bool:
+    def is_key_released(key: int) -> bool:
         """Return True if `key` is released, otherwise return False.
 
         Args:
-            * key (Key | Mouse | int): Key | int event code to inquire
-            about.
+            * key (int): `Key` or `Mouse` member (or any int) event code to
+            inquire about.
         """
         return is_key_released(int(key))
 
     @staticmethod
-    def is_key_down(key: Key | int) -> bool:
+    def is_key_down(key: int) -> bool:
         """Return True if `key` is down, otherwise return False.
 
         Args:
-            * key (Key | Mouse | int): Key | int event code to inquire
-            about.
+            * key (int): `Key` or `Mouse` member (or any int) event code to
+            inquire about.
         """
         return is_key_down(int(key))
 
@@ -89,7 +89,7 @@ class AppEvents(Item):
         self,
         callback: Callable = None,
         *,
-        key: Key | int = Key.ANY,
+        key: int = Key.ANY,
         user_data: Any = None,
         **kwargs,
     ):
@@ -100,7 +100,7 @@ class AppEvents(Item):
         self,
         callback: Callable = None,
         *,
-        key: Key | int = Key.ANY,
+        key: int = Key.ANY,
         user_data: Any = None,
         **kwargs,
     ):
@@ -111,7 +111,7 @@ class AppEvents(Item):
         self,
         callback: Callable = None,
         *,
-        key: Key | int = Key.ANY,
+        key: int = Key.ANY,
         user_data: Any = None,
         **kwargs,
     ):
@@ -122,7 +122,7 @@ class AppEvents(Item):
         self,
         callback: Callable = None,
         *,
-        button: Mouse | int = Mouse.ANY,
+        button: int = Mouse.ANY,
         user_data: Any = None,
         **kwargs,
     ):
@@ -133,7 +133,7 @@ class AppEvents(Item):
         self,
         callback: Callable = None,
         *,
-        button: Mouse | int = Mouse.ANY,
+        button: int = Mouse.ANY,
         user_data: Any = None,
         **kwargs,
     ):
@@ -144,7 +144,7 @@ class AppEvents(Item):
         self,
         callback: Callable = None,
         *,
-        button: Mouse | int = Mouse.ANY,
+        button: int = Mouse.ANY,
         user_data: Any = None,
         **kwargs,
     ):
@@ -155,7 +155,7 @@ class AppEvents(Item):
         self,
         callback: Callable = None,
         *,
-        button: Mouse | int = Mouse.ANY,
+        button: int = Mouse.ANY,
         user_data: Any = None,
         **kwargs,
     ):
@@ -178,7 +178,7 @@ class AppEvents(Item):
         self,
         callback: Callable = None,
         *,
-        button: Mouse | int = Mouse.ANY,
+        button: int = Mouse.ANY,
         threshold: float = 10.0,
         user_data: Any = None,
         **kwargs,
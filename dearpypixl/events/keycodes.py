@@ -1,7 +1,10 @@
-from enum import IntEnum
+"""Keyboard and mouse button codes."""
+# These are namespaces of `int` constants instead of `IntEnum` types. Member access
+# is a normal class attribute lookup rather than a trip through `EnumMeta`.
+# They cannot be iterated, called (use `from_value`) or used with `isinstance`.
 
 
-class Key(IntEnum):
+class Key:
     ANY              = -1
     Break            = 3
     Backspace        = 8
@@ -153,10 +156,77 @@ class Key(IntEnum):
     IntlBackslash    = 226  # \
     UNIDENTIFIED     = 255
 
-class Mouse(IntEnum):
+class Mouse:
     ANY     = -1
     Left    = 0
     Right   = 1
     Middle  = 2
     Button1 = 3
     Button2 = 4
+
+
+class _Code(int):
+    # Members are stored as instances of this instead of plain integers so
+    # they have a readable repr. They are still `int`s to DearPyGui.
+    __slots__ = ()
+
+    _namespace: str            = ""
+    _names    : dict[int, str] = {}
+
+    def __repr__(self) -> str:
+        name = self._names.get(self)
+        if name is None:
+            return int.__repr__(self)
+        return f"{self._namespace}.{name}"
+
+    __str__ = int.__repr__
+
+    # `IntEnum` compatibility.
+    @property
+    def name(self) -> str | None:
+        return self._names.get(self)
+
+    @property
+    def value(self) -> int:
+        return int(self)
+
+
+class _KeyCode(_Code):
+    __slots__ = ()
+
+    _namespace = "Key"
+    _names     = {}
+
+
+class _MouseCode(_Code):
+    __slots__ = ()
+
+    _namespace = "Mouse"
+    _names     = {}
+
+
+def _bind_codes(namespace: type, code_type: type[_Code]) -> None:
+    # Aliased codes (i.e. `Return` and `Enter`) resolve to the first
+    # member defined, same as `IntEnum` did.
+    names    = code_type._names
+    by_value = {}
+    for name, value in [*vars(namespace).items()]:
+        if name.startswith("_") or not isinstance(value, int):
+            continue
+        names.setdefault(value, name)
+        member = by_value.setdefault(value, code_type(value))
+        setattr(namespace, name, member)
+    def from_value(value: int) -> _Code:
+        """Return the (named) member for a code i.e. `Key.from_value(13)` ->
+        `Key.Return`. Raises ValueError if the code is not a member.
+        """
+        try:
+            return by_value[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {namespace.__qualname__!r} code.") from None
+
+    namespace._by_value  = by_value
+    namespace.from_value = staticmethod(from_value)
+
+_bind_codes(Key, _KeyCode)
+_bind_codes(Mouse, _MouseCode)
@@ -473,6 +473,8 @@ class PlotAxisX(PlotAxis):  # NOTE: non built-in
             * lock_max (bool, optional):
             * time (bool, optional):
     """
+    __slots__ = ()
+
     def __init__(
         self,
         label             : str             = None           ,
@@ -537,6 +539,8 @@ class PlotAxisY(PlotAxis):  # NOTE: non built-in
             * lock_max (bool, optional):
             * time (bool, optional):
     """
+    __slots__ = ()
+
     def __init__(
         self,
         label             : str             = None           ,
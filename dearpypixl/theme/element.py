@@ -1,5 +1,6 @@
 from enum import Enum, IntEnum
-from typing import Any, Literal, Sequence, NamedTuple
+from types import MappingProxyType
+from typing import Any, Literal, Mapping, Sequence, NamedTuple
 from decimal import Decimal
 from dearpygui import _dearpygui, dearpygui
 from dearpygui.dearpygui import add_theme_color, add_theme_style, add_theme_component
@@ -225,12 +226,14 @@ class ThemeElementType(Enum):
 
     @classmethod
     def get(cls, category: ThemeCategory, kind: Literal[0, 1], target: int):
-        args = ThemeCategory(category), kind, target
-        for element in cls.__members__.values():
-            element_data = element[:3]
-            if args == element_data:
-                return element
-        return None
+        return _THEME_ELEMENTS.get((ThemeCategory(category), kind, target), None)
+
+
+# (category, kind, target) -> ThemeElementType; built once instead of scanning
+# the members on every `ThemeElementType.get` call.
+_THEME_ELEMENTS: Mapping[tuple[int, int, int], ThemeElementType] = MappingProxyType(
+    {element.value[:3]:element for element in ThemeElementType}
+)
 
 
 class ItemState(Enum):
@@ -79,6 +79,10 @@ class Viewport(AppItem):
 
     __primary_window_uuid = None
 
+    @classmethod
+    def _configuration(cls) -> dict[str, Any]:
+        return get_viewport_configuration(cls.tag)
+
     @property
     @__dearpypixl__.as_configuration
     def primary_window(self) -> Window: